@@ -1086,6 +1086,7 @@ class BOPDMD(DMDBase):
         self._time = None
         self._Atilde = None
         self._modes_activation_bitmask_proxy = None
+        self._dynamics_cache = None
 
     @property
     def svd_rank(self):
@@ -1211,12 +1212,31 @@ class BOPDMD(DMDBase):
     def dynamics(self):
         """
         Get the time evolution of each mode.
+        The time evolution is cached internally until the model is refitted
+        or the (active) eigenvalues/amplitudes change, a (writable) copy
+        is returned.
 
         :return: matrix that contains all the time evolution, stored by row.
         :rtype: numpy.ndarray
         """
-        t_omega = np.exp(np.outer(self.eigs, self._time))
-        return np.diag(self.amplitudes).dot(t_omega)
+        eigs = self.eigs
+        amplitudes = self.amplitudes
+
+        if self._dynamics_cache is not None:
+            cached_eigs, cached_amplitudes, dynamics = self._dynamics_cache
+            if np.array_equal(cached_eigs, eigs) and np.array_equal(
+                cached_amplitudes, amplitudes
+            ):
+                return dynamics.copy()
+
+        # Exponentiate in place, s.t. only one (r, T) array is allocated.
+        dynamics = np.outer(eigs, self._time)
+        np.exp(dynamics, out=dynamics)
+        dynamics *= amplitudes[:, None]
+        dynamics.flags.writeable = False
+
+        self._dynamics_cache = (eigs.copy(), amplitudes.copy(), dynamics)
+        return dynamics.copy()
 
     @property
     def amplitudes_std(self):
@@ -1448,6 +1468,7 @@ class BOPDMD(DMDBase):
 
         # Fit the data.
         self._b = self.operator.compute_operator(snp.T, self._time)
+        self._dynamics_cache = None
 
         return self
 
@@ -1488,9 +1509,7 @@ class BOPDMD(DMDBase):
                     self.operator.amplitudes_std,
                 )
                 # Compute forecast using average modes and eigs_k, b_k.
-                all_x[k] = np.linalg.multi_dot(
-                    [self.modes, np.diag(b_k), np.exp(np.outer(eigs_k, t))]
-                )
+                all_x[k] = (self.modes * b_k) @ np.exp(np.outer(eigs_k, t))
 
             # Return the average forecast and the variance.
             return np.mean(all_x, axis=0), np.var(all_x, axis=0)
@@ -284,9 +284,6 @@ class DMDBase:
             row.
         :rtype: numpy.ndarray
         """
-        temp = np.repeat(
-            self.eigs[:, None], self.dmd_timesteps.shape[0], axis=1
-        )
         tpow = (
             self.dmd_timesteps - self.original_time["t0"]
         ) / self.original_time["dt"]
@@ -298,7 +295,9 @@ class DMDBase:
         # Therefore tpow must be scaled appropriately.
         tpow = self._translate_eigs_exponent(tpow)
 
-        return np.power(temp, tpow) * self.amplitudes[:, None]
+        # Broadcast the eigenvalues against the exponents instead of
+        # building a repeated (r, T) copy of the eigenvalues.
+        return np.power(self.eigs[:, None], tpow) * self.amplitudes[:, None]
 
     def _translate_eigs_exponent(self, tpow):
         """
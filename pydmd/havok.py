@@ -16,7 +16,10 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 from matplotlib.gridspec import GridSpec
+from scipy.fft import next_fast_len
+from scipy.linalg import get_lapack_funcs
 from scipy.signal import lsim, StateSpace
+from scipy.sparse.linalg import LinearOperator, svds
 from scipy.stats import norm
 
 from .bopdmd import BOPDMD
@@ -131,8 +134,11 @@ class HAVOK:
         :return: the matrix that contains the time-delayed data.
         :rtype: numpy.ndarray
         """
-        if self._ho_snapshots is None:
+        if self._snapshots is None:
             raise ValueError("You need to call fit().")
+        # The Hankel matrix is not needed for fitting, build it on demand.
+        if self._ho_snapshots is None:
+            self._ho_snapshots = self.hankel(self._snapshots)
         return self._ho_snapshots
 
     @property
@@ -291,15 +297,7 @@ class HAVOK:
         if X.ndim == 1:
             X = X[None]
         n, m = X.shape
-
-        # Check that the input data contains enough observations.
-        m_min = self._lag * (self._delays - 1) + 1
-        if m < m_min:
-            raise ValueError(
-                "Not enough snapshots provided for "
-                f"{self._delays} delays and lag {self._lag}. "
-                f"Please provide at least {m_min} snapshots."
-            )
+        self._check_n_samples(m)
 
         Hm = m - ((self._delays - 1) * self._lag)
         H = np.empty((n * self._delays, Hm))
@@ -354,9 +352,7 @@ class HAVOK:
         if X.ndim == 1:
             X = X[None]
         n_samples = X.shape[-1]
-
-        # Compute the Hankel matrix.
-        hankel_matrix = self.hankel(X)
+        self._check_n_samples(n_samples)
 
         # Check the input time information and set the time vector.
         if isinstance(t, (int, float)):
@@ -382,14 +378,17 @@ class HAVOK:
 
         # Perform structured HAVOK (sHAVOK).
         if self._structured:
-            U, s, V = compute_svd(hankel_matrix[:, :-1], self._svd_rank)
+            U, s, V = self._compute_hankel_svd(X[:, :-1], self._svd_rank)
             self._r = len(s)
-            V2 = compute_svd(hankel_matrix[:, 1:], self._r)[-1]
+            V2 = self._compute_hankel_svd(X[:, 1:], self._r)[-1]
+            # The two SVDs are computed independently, hence the singular
+            # vectors may differ in sign. Align V2 to V before differencing.
+            V2 = V2 * np.where(np.sum(V * V2, axis=0) < 0, -1.0, 1.0)
             V_dot = (V2 - V) / dt
 
         # Perform standard HAVOK.
         else:
-            U, s, V = compute_svd(hankel_matrix, self._svd_rank)
+            U, s, V = self._compute_hankel_svd(X, self._svd_rank)
             self._r = len(s)
             V_dot = differentiate(V.T, dt).T
 
@@ -423,17 +422,13 @@ class HAVOK:
                 self._dmd.fit(V.T, V_dot.T)
 
             # Compute the full system matrix.
-            havok_operator = np.linalg.multi_dot(
-                [
-                    self._dmd.modes,
-                    np.diag(self._dmd.eigs),
-                    np.linalg.pinv(self._dmd.modes),
-                ]
-            )
+            havok_operator = (
+                self._dmd.modes * self._dmd.eigs
+            ) @ np.linalg.pinv(self._dmd.modes)
 
         # Set the input data information.
         self._snapshots = X
-        self._ho_snapshots = hankel_matrix
+        self._ho_snapshots = None
         self._time = time
 
         # Set the SVD information.
@@ -443,9 +438,9 @@ class HAVOK:
 
         # Save the full HAVOK operator.
         self._havok_operator = havok_operator
-        self._eigenvalues = np.linalg.eig(
+        self._eigenvalues = self._compute_eigenvalues(
             havok_operator[: -self._num_chaos, : -self._num_chaos]
-        )[0]
+        )
 
         return self
 
@@ -808,9 +803,104 @@ class HAVOK:
         """
         U = self._singular_vecs[:, : V.shape[-1]]
         s = self._singular_vals[: V.shape[-1]]
-        H = np.linalg.multi_dot([U, np.diag(s), V.conj().T])
+        H = (U * s) @ V.conj().T
         return self.dehankel(H)
 
+    def _check_n_samples(self, n_samples):
+        """
+        Helper function that checks that the input data contains enough
+        observations for the `delays` and `lag` of the HAVOK model.
+        """
+        m_min = self._lag * (self._delays - 1) + 1
+        if n_samples < m_min:
+            raise ValueError(
+                "Not enough snapshots provided for "
+                f"{self._delays} delays and lag {self._lag}. "
+                f"Please provide at least {m_min} snapshots."
+            )
+
+    def _hankel_operator(self, X):
+        """
+        Helper function that returns the Hankel matrix of the (n, m) data
+        matrix X as a linear operator, without building the matrix. The
+        matrix-vector products are cross-correlations of the rows of X,
+        computed with the FFT in O(n m log(m)) instead of O(n m delays).
+        """
+        n, m = X.shape
+        Hm = m - ((self._delays - 1) * self._lag)
+        offsets = np.arange(self._delays) * self._lag
+
+        # The FFT of the data is computed once and shared by both products.
+        # Circular cross-correlations of length >= m are exact for all the
+        # needed shifts, s.t. no reversed or padded copy of X is required.
+        n_fft = next_fast_len(m, real=True)
+        X_fft = np.fft.rfft(X, n_fft)
+
+        def matvec(v):
+            v_fft = np.fft.rfft(np.ravel(v), n_fft)
+            corr = np.fft.irfft(X_fft * v_fft.conj(), n_fft)
+            return corr[:, offsets].T.ravel()
+
+        def rmatvec(u):
+            w = np.zeros((n, offsets[-1] + 1))
+            w[:, offsets] = np.reshape(u, (self._delays, n)).T
+            w_fft = np.fft.rfft(w, n_fft)
+            corr = np.fft.irfft(X_fft * w_fft.conj(), n_fft)
+            return corr[:, :Hm].sum(axis=0)
+
+        return LinearOperator(
+            (n * self._delays, Hm), matvec=matvec, rmatvec=rmatvec, dtype=float
+        )
+
+    def _compute_hankel_svd(self, X, svd_rank):
+        """
+        Helper function that computes the truncated SVD of the Hankel matrix
+        of the (n, m) data matrix X. If only a few singular triplets of a
+        Hankel matrix with many rows are requested, they are computed
+        iteratively with FFT-based products, otherwise the Hankel matrix is
+        built and decomposed with `compute_svd`.
+        """
+        n_min = min(
+            X.shape[0] * self._delays,
+            X.shape[-1] - ((self._delays - 1) * self._lag),
+        )
+        if (
+            isinstance(svd_rank, (int, np.integer))
+            and not isinstance(svd_rank, bool)
+            and n_min >= 256
+            and 0 < 4 * svd_rank <= n_min
+        ):
+            hankel_op = self._hankel_operator(X)
+            v0 = np.full(n_min, 1.0 / np.sqrt(n_min))
+            U, s, Vh = svds(hankel_op, k=svd_rank, v0=v0)
+            # svds returns the singular values in ascending order.
+            return U[:, ::-1], s[::-1], Vh[::-1].conj().T
+
+        return compute_svd(self.hankel(X), svd_rank)
+
+    @staticmethod
+    def _compute_eigenvalues(A):
+        """
+        Helper function that computes the eigenvalues of the (small) square
+        matrix A. LAPACK's geev is called directly without eigenvectors,
+        since the numpy wrapper overhead dominates for matrices of this size.
+        As with numpy.linalg.eig, the eigenvalues of a real matrix are real
+        if none of them has an imaginary part.
+        """
+        if not np.all(np.isfinite(A)):
+            raise np.linalg.LinAlgError("Array must not contain infs or NaNs")
+
+        (geev,) = get_lapack_funcs(("geev",), (A,))
+        if np.iscomplexobj(A):
+            eigs, _, _, info = geev(A, compute_vl=0, compute_vr=0)
+        else:
+            eigs_re, eigs_im, _, _, info = geev(A, compute_vl=0, compute_vr=0)
+            eigs = eigs_re + 1j * eigs_im if np.any(eigs_im) else eigs_re
+        if info > 0:
+            raise np.linalg.LinAlgError("Eigenvalues did not converge")
+
+        return eigs
+
     @staticmethod
     def _get_index_slices(x, min_jump_dist):
         """
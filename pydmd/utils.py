@@ -6,6 +6,7 @@ from typing import NamedTuple
 from collections import namedtuple
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
+from scipy.linalg import svd
 
 #  Named tuples used in functions.
 #  compute_svd uses "SVD",
@@ -112,7 +113,8 @@ def compute_rank(X: np.ndarray, svd_rank: Number = 0) -> int:
     singular values is, IEEE Transactions on Information Theory 60.8
     (2014): 5040-5053.
     """
-    _, s, _ = np.linalg.svd(X, full_matrices=False)
+    # only the singular values are needed
+    s = svd(X, compute_uv=False, check_finite=False, lapack_driver="gesdd")
     return _compute_rank(s, X.shape[0], X.shape[1], svd_rank)
 
 
@@ -180,7 +182,9 @@ def compute_svd(
     singular values is, IEEE Transactions on Information Theory 60.8
     (2014): 5040-5053.
     """
-    U, s, V = np.linalg.svd(X, full_matrices=False)
+    U, s, V = svd(
+        X, full_matrices=False, check_finite=False, lapack_driver="gesdd"
+    )
     rank = _compute_rank(s, X.shape[0], X.shape[1], svd_rank)
     V = V.conj().T
 
@@ -14,20 +14,29 @@ Default optimizer arguments:
         "gtol": 1e-8,
         "xtol": 1e-8,
         "ftol": 1e-8}
+
+If the optimizer arguments contain `"tr_solver": "lsmr"`, the Jacobian
+is not materialized but passed as linear operator. Since SciPy cannot
+scale the variables w.r.t. a linear operator, `"x_scale": "jac"`
+is replaced by `"x_scale": 1.0` in this case.
 """
 
+import copy
+import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from types import MappingProxyType
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, List, Tuple, Union
 
 import numpy as np
-from scipy.linalg import qr
+from scipy.linalg import get_lapack_funcs
 from scipy.optimize import OptimizeResult, least_squares
+from scipy.sparse.linalg import LinearOperator
 
 from .dmd import DMDBase
 from .dmdoperator import DMDOperator
 from .snapshots import Snapshots
-from .utils import compute_svd
+from .utils import _compute_rank, compute_rqb, compute_svd
 
 OPT_DEF_ARGS = MappingProxyType(
     {
@@ -70,10 +79,11 @@ def _compute_dmd_ev(
     # columns of v need to be multiplicated with inverse sigma
     sigma_inv_approx = np.reciprocal(sigma_x)
 
-    a_approx = np.linalg.multi_dot(
-        [u_x.conj().T, x_next, sigma_inv_approx[None] * v_x]
-    )
+    # the chain is short and the order fixed (u^H x' is the thin product),
+    # two plain GEMMs avoid multi_dot's ordering overhead.
+    a_approx = (u_x.conj().T @ x_next) @ (sigma_inv_approx[None] * v_x)
 
+    # eigvals calls geev without eigenvectors (jobvl = jobvr = 'N')
     return np.linalg.eigvals(a_approx)
 
 
@@ -82,15 +92,82 @@ class _OptimizeHelper:  # pylint: disable=too-few-public-methods
     Helper Class to store intermediate results during the optimization.
     """
 
-    __slots__ = ["phi", "phi_inv", "u_svd", "s_inv", "v_svd", "b_matrix", "rho"]
+    __slots__ = [
+        "phi",
+        "phi_inv",
+        "u_svd",
+        "s_inv",
+        "v_svd",
+        "b_matrix",
+        "rho",
+        "alphas",
+        "d_phi",
+        "jac_cplx",
+        "jac_out",
+        "jac_blocks",
+        "time_col",
+        "last_alphas",
+        "last_rho_out",
+    ]
 
-    def __init__(self, l_in: int, m_in: int, n_in: int):
-        self.phi = np.empty((m_in, l_in), dtype=np.complex128)
-        self.u_svd = np.empty((m_in, l_in), dtype=np.complex128)
-        self.s_inv = np.empty((l_in,), dtype=np.complex128)
-        self.v_svd = np.empty((l_in, l_in), dtype=np.complex128)
-        self.b_matrix = np.empty((l_in, n_in), dtype=np.complex128)
-        self.rho = np.empty((m_in, n_in), dtype=np.complex128)
+    def __init__(
+        self,
+        l_in: int,
+        m_in: int,
+        n_in: int,
+        dtype: type = np.complex128,
+        time: np.ndarray = None,
+        jac_op: bool = False,
+    ):
+        self.phi = np.empty((m_in, l_in), dtype=dtype)
+        self.phi_inv = np.empty((l_in, m_in), dtype=dtype)
+        self.u_svd = np.empty((m_in, l_in), dtype=dtype)
+        self.s_inv = np.empty((l_in,), dtype=dtype)
+        self.v_svd = np.empty((l_in, l_in), dtype=dtype)
+        self.b_matrix = np.empty((l_in, n_in), dtype=dtype)
+        self.rho = np.empty((m_in, n_in), dtype=dtype)
+
+        # scratch buffers, reused by every residual/Jacobian evaluation
+        self.alphas = np.empty((l_in,), dtype=dtype)
+        self.d_phi = np.empty((m_in, l_in), dtype=dtype)
+
+        # the (dense) Jacobian is the largest array of the optimization,
+        # not needed if it is passed as linear operator.
+        self.jac_cplx = None
+        self.jac_out = None
+        self.jac_blocks = None
+        if not jac_op:
+            # The layouts are chosen for the (fixed) shapes: one contiguous
+            # (m x n) block per eigenvalue, hence every column of the
+            # column major real Jacobian is a contiguous copy.
+            # LAPACK (SVD in the optimizer) works on column major
+            # arrays as well, so no further copy is required there.
+            self.jac_cplx = np.empty((l_in, m_in, n_in), dtype=dtype)
+            # the optimizer itself always works in double precision
+            self.jac_out = np.empty(
+                (2 * m_in * n_in, 2 * l_in), dtype=np.float64, order="F"
+            )
+            n_rows = m_in * n_in
+            self.jac_blocks = (
+                self.jac_out[:n_rows, :l_in],
+                self.jac_out[n_rows:, :l_in],
+                self.jac_out[:n_rows, l_in:],
+                self.jac_out[n_rows:, l_in:],
+            )
+
+        # parameters and result of the latest residual evaluation,
+        # the entities above belong to these parameters.
+        self.last_alphas = None
+        self.last_rho_out = None
+
+        # time as column, broadcast against phi in every evaluation
+        self.time_col = (
+            None
+            if time is None
+            else np.ascontiguousarray(
+                time[:, None], dtype=np.finfo(dtype).dtype
+            )
+        )
 
 
 def _compute_dmd_rho(
@@ -121,34 +198,72 @@ def _compute_dmd_rho(
     :rtype: np.ndarray
     """
 
-    _alphas = np.zeros((alphas.shape[-1] // 2,), dtype=np.complex128)
+    # residual (and entities for the Jacobian) were already computed
+    if opthelper.last_alphas is not None and np.array_equal(
+        alphas, opthelper.last_alphas
+    ):
+        return opthelper.last_rho_out
+
+    _alphas = opthelper.alphas
     _alphas.real = alphas[: alphas.shape[-1] // 2]
     _alphas.imag = alphas[alphas.shape[-1] // 2 :]
 
-    phi = np.exp(np.outer(time, _alphas))
-    u_phi, s_phi, v_phi_t = np.linalg.svd(phi, full_matrices=False)
-    idx = np.where(s_phi.real != 0.0)[0]
-    s_phi_inv = np.zeros_like(s_phi)
-    s_phi_inv[idx] = np.reciprocal(s_phi[idx])
+    phi = opthelper.phi
+    time_col = (
+        time[:, None] if opthelper.time_col is None else opthelper.time_col
+    )
+    np.multiply(time_col, _alphas[None], out=phi)
+    np.exp(phi, out=phi)
+
+    # A (thin) QR decomposition is sufficient to span range(phi)
+    # and to compute the pseudo inverse if phi has full column rank.
+    # The SVD is only used as fallback for (numerically) rank deficient phi.
+    # LAPACK routines are called directly to avoid the wrapper overhead
+    # (input validation and copies),
+    # which is significant for the small matrices at hand.
+    # Hence phi (i.e. alphas and time) must be finite.
+    geqrf, ungqr, trtri, gesdd = get_lapack_funcs(
+        ("geqrf", "ungqr", "trtri", "gesdd"), (phi,)
+    )
+    full_rank = phi.shape[0] >= phi.shape[-1]
+
+    if full_rank:
+        qr_phi, tau = geqrf(phi)[:2]
+        r_phi = np.triu(qr_phi[: phi.shape[-1]])
+        r_diag = np.abs(np.diag(r_phi))
+        rcond = np.finfo(r_diag.dtype).eps * max(phi.shape)
+        full_rank = r_diag.min() > rcond * r_diag.max()
+
+    if full_rank:
+        u_phi = ungqr(qr_phi, tau)[0]
+        phi_inv_left = trtri(r_phi)[0]
 
-    rho = data - np.linalg.multi_dot([u_phi, u_phi.conj().T, data])
+    else:
+        # phi is kept by the helper for the Jacobian, must not be overwritten
+        u_phi, s_phi, v_phi_t, info = gesdd(
+            phi, compute_uv=1, full_matrices=0, overwrite_a=0
+        )
+        if info > 0:
+            raise np.linalg.LinAlgError("SVD did not converge")
+        idx = np.where(s_phi.real != 0.0)[0]
+        s_phi_inv = np.zeros_like(s_phi)
+        s_phi_inv[idx] = np.reciprocal(s_phi[idx])
+        opthelper.s_inv = s_phi_inv
+        opthelper.v_svd = v_phi_t.conj().T
+        phi_inv_left = opthelper.v_svd * s_phi_inv[None]
+
+    # project onto range(phi) without forming the (m x m) projector
+    u_h_data = u_phi.conj().T @ data
+    rho = data - u_phi @ u_h_data
     rho_flat = np.ravel(rho)
-    rho_out = np.zeros((2 * rho_flat.shape[-1],), dtype=np.float64)
-    rho_out[: rho_flat.shape[-1]] = rho_flat.real
-    rho_out[rho_flat.shape[-1] :] = rho_flat.imag
+    rho_out = np.concatenate((rho_flat.real, rho_flat.imag), dtype=np.float64)
 
-    opthelper.phi = phi
     opthelper.u_svd = u_phi
-    opthelper.s_inv = s_phi_inv
-    opthelper.v_svd = v_phi_t.conj().T
+    opthelper.phi_inv = phi_inv_left @ u_phi.conj().T
     opthelper.rho = rho
-    opthelper.b_matrix = np.linalg.multi_dot(
-        [
-            opthelper.v_svd * s_phi_inv[None],
-            opthelper.u_svd.conj().T,
-            data,
-        ]
-    )
+    opthelper.b_matrix = phi_inv_left @ u_h_data
+    opthelper.last_alphas = alphas.copy()
+    opthelper.last_rho_out = rho_out
     return rho_out
 
 
@@ -180,42 +295,122 @@ def _compute_dmd_jac(
     :rtype: np.ndarray
     """
 
-    _alphas = np.zeros((alphas.shape[-1] // 2,), dtype=np.complex128)
-    _alphas.real = alphas[: alphas.shape[-1] // 2]
-    _alphas.imag = alphas[alphas.shape[-1] // 2 :]
-    jac_out = np.zeros((2 * np.prod(data.shape), alphas.shape[-1]))
+    n_alphas = alphas.shape[-1] // 2
+    m_in, n_in = data.shape
+    a_mat = opthelper.jac_cplx
+    jac_out = opthelper.jac_out
 
-    for j in range(_alphas.shape[-1]):
-        d_phi_j = time * opthelper.phi[:, j]
-        outer = np.outer(d_phi_j, opthelper.b_matrix[j])
-        a_j = outer - np.linalg.multi_dot(
-            [opthelper.u_svd, opthelper.u_svd.conj().T, outer]
-        )
-        g_j = np.linalg.multi_dot(
-            [
-                opthelper.u_svd * opthelper.s_inv[None],
-                np.outer(
-                    opthelper.v_svd[j].conj(), d_phi_j.conj() @ opthelper.rho
-                ),
-            ]
-        )
-        # Compute the jacobian J_mat_j = - (A_j + G_j).
-        jac = -a_j - g_j
-        jac_flat = np.ravel(jac)
+    # all partial derivatives of phi at once, column j is t * phi_j
+    d_phi = opthelper.d_phi
+    time_col = (
+        time[:, None] if opthelper.time_col is None else opthelper.time_col
+    )
+    np.multiply(time_col, opthelper.phi, out=d_phi)
+
+    # A_j = (d_phi_j - U U^H d_phi_j) b_j^T.
+    # The projection only acts on d_phi_j, so it is applied before
+    # the outer products are formed.
+    d_phi_proj = d_phi - opthelper.u_svd @ (opthelper.u_svd.conj().T @ d_phi)
+
+    # G_j = phi^+^H e_j (d_phi_j^H rho)
+    g_left = opthelper.phi_inv.conj().T
+    g_right = d_phi.conj().T @ opthelper.rho
+
+    # Both terms are outer products, hence A_j + G_j is a
+    # rank 2 product |d_phi_proj_j g_left_j| |b_j^T; g_right_j^T|.
+    # All l products are evaluated by one batched matmul,
+    # one (m x n) block per eigenvalue.
+    np.matmul(
+        np.stack((d_phi_proj, g_left), axis=-1).transpose(1, 0, 2),
+        np.stack((opthelper.b_matrix, g_right), axis=1),
+        out=a_mat,
+    )
 
-        # construct the overall jacobian for optimized
-        # J_real = |Re{J} -Im{J}|
-        #          |Im{J}  Re{J}|
+    # The jacobian is J_mat_j = - (A_j + G_j).
+    # Construct the overall jacobian for optimized
+    # J_real = |Re{J} -Im{J}|
+    #          |Im{J}  Re{J}|
+    # The sign of J is folded into the writes, A + G
+    # is never negated as a complex array.
+    a_flat = a_mat.reshape((n_alphas, m_in * n_in)).T
+    re_top, im_bottom, neg_im_top, re_bottom = opthelper.jac_blocks
+    np.negative(a_flat.real, out=re_top)
+    np.negative(a_flat.imag, out=im_bottom)
+    neg_im_top[...] = a_flat.imag
+    re_bottom[...] = re_top
 
-        # construct real part for optimization
-        jac_out[: jac_out.shape[0] // 2, j] = jac_flat.real
-        jac_out[jac_out.shape[0] // 2 :, j] = jac_flat.imag
+    return jac_out
 
-        # construct imaginary part for optimization
-        jac_out[: jac_out.shape[0] // 2, _alphas.shape[-1] + j] = -jac_flat.imag
-        jac_out[jac_out.shape[0] // 2 :, _alphas.shape[-1] + j] = jac_flat.real
 
-    return jac_out
+def _compute_dmd_jac_op(
+    alphas: np.ndarray,
+    time: np.ndarray,
+    data: np.ndarray,
+    opthelper: _OptimizeHelper,
+) -> LinearOperator:
+    r"""
+    Compute the real Jacobian as linear operator.
+    Instead of materializing the Jacobian
+    :math:`\boldsymbol{J} \in \mathbb{R}^{2mn \times 2l}`,
+    only the factors of :math:`\boldsymbol{J}` are computed, s.t.
+    products :math:`\boldsymbol{J}\boldsymbol{x}`
+    and :math:`\boldsymbol{J}^T\boldsymbol{y}` can be evaluated
+    with a few small matrix products. Requires `tr_solver="lsmr"`.
+
+    :param alphas: DMD eigenvalues to optimize,
+        where :math:`\alpha \in \mathbb{C}^l`,
+        but here :math:`\alpha \in \mathbb{R}^{2l}` since optimizer cannot
+        deal with complex numbers.
+    :type alphas: np.ndarray
+    :param time: 1D time array.
+    :type time: np.ndarray
+    :param data: data :math: `\boldsymbol{Y} \n C^{m \times n}`.
+        For DMD computation we set :math:`\boldsymbol{Y} = \boldsymbol{X}^T`.
+    :type data: np.ndarray
+    :param opthelper: Optimization helper to speed up computations
+        mainly for Jacobian. The entities are computed in `_compute_dmd_rho`.
+    :type opthelper: _OptimizeHelper
+    :return: Jacobian :math:`\boldsymbol{J} \in \mathbb{R}^{2mn \times 2l}`
+        as linear operator.
+    :rtype: LinearOperator
+    """
+
+    n_alphas = alphas.shape[-1] // 2
+    m_in, n_in = data.shape
+    n_rho = m_in * n_in
+
+    # J_j = -(d_phi_proj_j b_j^T + g_left_j g_right_j^T)
+    d_phi = opthelper.d_phi
+    time_col = (
+        time[:, None] if opthelper.time_col is None else opthelper.time_col
+    )
+    np.multiply(time_col, opthelper.phi, out=d_phi)
+    d_phi_proj = d_phi - opthelper.u_svd @ (opthelper.u_svd.conj().T @ d_phi)
+    g_left = opthelper.phi_inv.conj().T
+    g_right = d_phi.conj().T @ opthelper.rho
+    b_matrix = opthelper.b_matrix
+
+    def matvec(vec: np.ndarray) -> np.ndarray:
+        vec = np.ravel(vec)
+        coeffs = vec[:n_alphas] + 1j * vec[n_alphas:]
+        jac_vec = (d_phi_proj * coeffs[None]) @ b_matrix
+        jac_vec += (g_left * coeffs[None]) @ g_right
+        jac_vec = np.ravel(jac_vec)
+        return -np.concatenate((jac_vec.real, jac_vec.imag), dtype=np.float64)
+
+    def rmatvec(vec: np.ndarray) -> np.ndarray:
+        vec = np.ravel(vec)
+        rhs = (vec[:n_rho] + 1j * vec[n_rho:]).reshape((m_in, n_in))
+        grad = np.sum((d_phi_proj.conj().T @ rhs) * b_matrix.conj(), axis=1)
+        grad += np.sum((g_left.conj().T @ rhs) * g_right.conj(), axis=1)
+        return -np.concatenate((grad.real, grad.imag), dtype=np.float64)
+
+    return LinearOperator(
+        (2 * n_rho, alphas.shape[-1]),
+        matvec=matvec,
+        rmatvec=rmatvec,
+        dtype=np.float64,
+    )
 
 
 def _varpro_preprocessing(
@@ -223,6 +418,7 @@ def _varpro_preprocessing(
     time: np.ndarray,
     rank: Union[float, int] = 0.0,
     use_proj: bool = True,
+    svd: Tuple[np.ndarray, np.ndarray, np.ndarray] = None,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     r"""
     Preprocess data for Variable Projection: Calculate
@@ -241,12 +437,17 @@ def _varpro_preprocessing(
         the cumulative energy of the singular values is used
         to determine the optimal rank. If rank is an integer
         and :math:`r > 0`, the desired rank is used iff possible.
-        Defaults to 0.
+        If :math:`r` is an integer smaller than a quarter of the smallest
+        data dimension, a randomized SVD is used. Defaults to 0.
     :type rank: Union[float, int], optional
     :param use_proj: Perform variable projection in
         low dimensional space if `use_proj=True`, else in the original space.
         Defaults to True.
     :type use_proj: bool, optional
+    :param svd: Precomputed truncated SVD :math:`\boldsymbol{U}_r,
+        \boldsymbol{\Sigma}_r, \boldsymbol{V}_r` of the data matrix.
+        If None, the SVD is computed. Defaults to None.
+    :type svd: Tuple[np.ndarray, np.ndarray, np.ndarray], optional
     :return: Derivative :math:`\boldsymbol{Y},\boldsymbol{Z}`, (projected) data,
          rank reduced projection matrix :math:`\boldsymbol{U}_r`.
     :rtype: Tuple[np.ndarray,
@@ -255,7 +456,24 @@ def _varpro_preprocessing(
                   np.ndarray]
     """
 
-    u_r, s_r, v_r = compute_svd(data, rank)
+    if (
+        svd is None
+        and isinstance(rank, int)
+        and 0 < rank < min(data.shape) // 4
+    ):
+        # Only few components are needed, a randomized SVD
+        # (see Erichson et al., Randomized dynamic mode decomposition)
+        # avoids the full decomposition of the data. The test matrix is
+        # passed explicitly, otherwise compute_rqb determines the rank
+        # with a (full) SVD of the data.
+        test_matrix = np.random.default_rng(0).standard_normal(
+            (data.shape[-1], rank + 10)
+        )
+        q_r, b_r = compute_rqb(data, rank, 10, 2, test_matrix=test_matrix)[:2]
+        u_b, s_r, v_r = compute_svd(b_r, rank)
+        svd = (q_r @ u_b, s_r, v_r)
+
+    u_r, s_r, v_r = compute_svd(data, rank) if svd is None else svd
     data_out = v_r.conj().T * s_r[:, None] if use_proj else data
 
     # trapezoidal derivative approximation
@@ -285,16 +503,24 @@ def _compute_dmd_varpro(
     :type data: np.ndarray
     :param opthelper: Optimization helper to speed up computations
         mainly for Jacobian. The entities are computed in `_compute_dmd_rho`
-        and are used in `_compute_dmd_jac`.
+        and are used in `_compute_dmd_jac`. If `tr_solver="lsmr"`,
+        the Jacobian is passed as linear operator (`_compute_dmd_jac_op`)
+        and `x_scale="jac"` falls back to `x_scale=1.0`.
     :type opthelper: _OptimizeHelper
     :return: Optimization result.
     :rtype: OptimizeResult
     """
 
+    jac = _compute_dmd_jac
+    if optargs.get("tr_solver") == "lsmr":
+        jac = _compute_dmd_jac_op
+        if optargs.get("x_scale") == "jac":
+            optargs["x_scale"] = 1.0
+
     return least_squares(
         _compute_dmd_rho,
         alphas_init,
-        _compute_dmd_jac,
+        jac,
         **optargs,
         args=[time, data, opthelper],
     )
@@ -325,7 +551,11 @@ def select_best_samples_fast(data: np.ndarray, comp: float = 0.9) -> np.ndarray:
         raise ValueError("Compression must be in (0, 1)]")
 
     n_samples = int(data.shape[-1] * (1.0 - comp))
-    pcolumn = qr(data, mode="economic", pivoting=True)[-1]
+
+    # Only the column permutation is required, hence LAPACK's
+    # pivoted QR is called directly s.t. Q is never formed.
+    (geqp3,) = get_lapack_funcs(("geqp3",), (data,))
+    pcolumn = geqp3(data)[1] - 1
 
     return pcolumn[:n_samples]
 
@@ -337,11 +567,13 @@ def compute_varprodmd_any(  # pylint: disable=unused-variable
     rank: Union[float, int] = 0.0,
     use_proj: bool = True,
     compression: float = 0,
+    mixed_precision: bool = False,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, OptimizeResult]:
     r"""
     Compute DMD given arbitary timesteps.
 
     :param data: data matrix s.t. :math:`X \n C^{n \times m}`.
+        Data and time must be finite, they are not validated.
     :type data: np.ndarray
     :param time: 1d array of timestamps.
     :type time: np.ndarray
@@ -363,6 +595,12 @@ def compute_varprodmd_any(  # pylint: disable=unused-variable
         fitting :math:`\lfloor \left(1 - c\right)m\rfloor` samples
         are selected.
     :type compression: float, optional
+    :param mixed_precision: If True, the optimization is performed in single
+        precision (complex64) first, until the (capped) tolerances
+        are met. The result is refined in double precision afterwards.
+        Reduces the cost of the bulk of the iterations for well conditioned
+        problems. Defaults to False.
+    :type mixed_precision: bool, optional
     :raises ValueError: ValueError is raised if data matrix is not a
         2d array.
     :raises ValueError: ValueError is raised if time is not a
@@ -386,6 +624,50 @@ def compute_varprodmd_any(  # pylint: disable=unused-variable
 
     #  y_in, z_in, data_in, u_r
     res = _varpro_preprocessing(data, time, rank, use_proj)
+    return _compute_varprodmd_preprocessed(
+        res, time, optargs, use_proj, compression, mixed_precision
+    )
+
+
+def _compute_varprodmd_preprocessed(
+    res: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    time: np.ndarray,
+    optargs: Dict[str, Any],
+    use_proj: bool,
+    compression: float,
+    mixed_precision: bool = False,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, OptimizeResult]:
+    r"""
+    Compute DMD from preprocessed data (see `_varpro_preprocessing`).
+
+    :param res: Derivative :math:`\boldsymbol{Y},\boldsymbol{Z}`,
+        (projected) data, rank reduced projection matrix
+        :math:`\boldsymbol{U}_r`.
+    :type res: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    :param time: 1d array of timestamps.
+    :type time: np.ndarray
+    :param optargs: Arguments for 'least_squares' optimizer.
+    :type optargs: Dict[str, Any]
+    :param use_proj: Variable projection is performed in
+        low dimensional space if `use_proj=True`, else in the original space.
+    :type use_proj: bool
+    :param compression: Library compression :math:`c`.
+    :type compression: float
+    :param mixed_precision: Run a single precision optimization first
+        and refine its result in double precision. Defaults to False.
+    :type mixed_precision: bool, optional
+    :return: DMD modes :math:`\boldsymbol{\Phi}`, continuous DMD eigenvalues
+        :math: `\boldsymbol{\Omega}` as 1d array,
+        DMD eigenfunctions or amplitudes :math:`\boldsymbol{\varphi}`,
+        indices of selected samples,
+        optimization results of SciPy's nonlinear least squares optimizer.
+    :rtype: Tuple[np.ndarray,
+                  np.ndarray,
+                  np.ndarray,
+                  np.ndarray,
+                  OptimizeResult]
+    """
+
     omegas = _compute_dmd_ev(res[0], res[1], res[-1].shape[-1])
 
     if compression > 0:
@@ -407,14 +689,60 @@ def compute_varprodmd_any(  # pylint: disable=unused-variable
             )
         )
 
-    opthelper = _OptimizeHelper(res[-1].shape[-1], *res[2].shape)
+    alphas_init = np.concatenate([omegas.real, omegas.imag])
+    data_in = res[2][:, indices].T
+    jac_op = optargs.get("tr_solver") == "lsmr"
+
+    if mixed_precision:
+        # Approach the optimum with (cheaper) single precision
+        # iterations first. The tolerances are capped to what
+        # single precision can resolve.
+        tol = np.sqrt(np.finfo(np.float32).eps)
+        optargs_single = dict(optargs)
+        for key in ("ftol", "xtol", "gtol"):
+            optargs_single[key] = max(optargs.get(key) or 0.0, tol)
+
+        # phi overflows much earlier in single precision. Overflows are
+        # raised where they occur (before the optimizer sees non-finite
+        # values). If the iterations break down, the double precision
+        # optimization starts from the initial guess.
+        try:
+            with np.errstate(over="raise", invalid="raise"):
+                alphas_init = _compute_dmd_varpro(
+                    alphas_init,
+                    time[indices],
+                    data_in.astype(np.complex64),
+                    _OptimizeHelper(
+                        res[-1].shape[-1],
+                        *data_in.shape,
+                        dtype=np.complex64,
+                        time=time[indices],
+                        jac_op=jac_op,
+                    ),
+                    **optargs_single,
+                ).x
+        except (FloatingPointError, np.linalg.LinAlgError) as error:
+            warnings.warn(
+                "Single precision stage failed "
+                f"({type(error).__name__}: {error}), "
+                "continuing with double precision from the initial guess."
+            )
+
+    opthelper = _OptimizeHelper(
+        res[-1].shape[-1], *data_in.shape, time=time[indices], jac_op=jac_op
+    )
     opt = _compute_dmd_varpro(
-        np.concatenate([omegas.real, omegas.imag]),
+        alphas_init,
         time[indices],
-        res[2][:, indices].T,
+        data_in,
         opthelper,
         **optargs,
     )
+
+    # The latest evaluation may belong to a rejected step,
+    # make sure the amplitudes belong to the optimum.
+    # This is a cache hit in most cases.
+    _compute_dmd_rho(opt.x, time[indices], data_in, opthelper)
     omegas.real = opt.x[: opt.x.shape[-1] // 2]
     omegas.imag = opt.x[opt.x.shape[-1] // 2 :]
     xi = res[-1] @ opthelper.b_matrix.T if use_proj else opthelper.b_matrix.T
@@ -422,6 +750,165 @@ def compute_varprodmd_any(  # pylint: disable=unused-variable
     return xi / eigenf[None], omegas, eigenf, indices, opt
 
 
+def compute_varprodmd_batch(
+    data: np.ndarray,
+    time: np.ndarray,
+    optargs: Dict[str, Any],
+    rank: Union[float, int] = 0.0,
+    use_proj: bool = True,
+    compression: float = 0,
+    mixed_precision: bool = False,
+) -> List[
+    Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, OptimizeResult]
+]:
+    r"""
+    Compute DMD for a batch of independent problems of identical shape,
+    e.g. several time windows of the same signal.
+    The SVDs of all data matrices are computed by one (batched)
+    LAPACK call, the optimization is performed for each problem separately.
+
+    :param data: Stacked data matrices s.t.
+        :math:`X \n C^{b \times n \times m}`.
+    :type data: np.ndarray
+    :param time: Stacked timestamps as 2d array of shape :math:`b \times m`.
+    :type time: np.ndarray
+    :param optargs: Arguments for 'least_squares' optimizer.
+    :type optargs: Dict[str, Any]
+    :param rank: Desired rank. If rank :math:`r = 0`, the optimal rank is
+        determined automatically. If rank is a float s.t. :math:`0 < r < 1`,
+        the cumulative energy of the singular values is used
+        to determine the optimal rank. If rank is an integer
+        and :math:`r > 0`, the desired rank is used iff possible.
+        The rank is determined for each problem separately.
+        Defaults to 0.
+    :type rank: Union[float, int], optional
+    :param use_proj: Perform variable projection in
+        low dimensional space if `use_proj=True`, else in the original space.
+        Defaults to True.
+    :type use_proj: bool, optional
+    :param compression: If libary compression :math:`c = 0`,
+        all samples are used. If :math:`0 < c < 1`, the best
+        fitting :math:`\lfloor \left(1 - c\right)m\rfloor` samples
+        are selected.
+    :type compression: float, optional
+    :param mixed_precision: If True, the optimization is performed in single
+        precision (complex64) first, until the (capped) tolerances
+        are met. The result is refined in double precision afterwards.
+        Reduces the cost of the bulk of the iterations for well conditioned
+        problems. Defaults to False.
+    :type mixed_precision: bool, optional
+    :raises ValueError: ValueError is raised if data is not a 3d array.
+    :raises ValueError: ValueError is raised if time is not a 2d array
+        matching the batch size and the number of samples.
+    :return: For each problem: DMD modes :math:`\boldsymbol{\Phi}`,
+        continuous DMD eigenvalues :math: `\boldsymbol{\Omega}` as 1d array,
+        DMD eigenfunctions or amplitudes :math:`\boldsymbol{\varphi}`,
+        indices of selected samples,
+        optimization results of SciPy's nonlinear least squares optimizer.
+    :rtype: List[Tuple[np.ndarray,
+                       np.ndarray,
+                       np.ndarray,
+                       np.ndarray,
+                       OptimizeResult]]
+    """
+
+    if len(data.shape) != 3:
+        raise ValueError("data needs to be 3D array")
+
+    if time.shape != (data.shape[0], data.shape[-1]):
+        raise ValueError("time needs to be a 2D array of shape (batch, m)")
+
+    u_b, s_b, v_b = np.linalg.svd(data, full_matrices=False)
+    v_b = np.swapaxes(v_b, -1, -2).conj()
+
+    out = []
+    for u_x, s_x, v_x, data_x, time_x in zip(u_b, s_b, v_b, data, time):
+        r_x = _compute_rank(s_x, *data_x.shape, rank)
+        res = _varpro_preprocessing(
+            data_x,
+            time_x,
+            rank,
+            use_proj,
+            (u_x[:, :r_x], s_x[:r_x], v_x[:, :r_x]),
+        )
+        out.append(
+            _compute_varprodmd_preprocessed(
+                res, time_x, optargs, use_proj, compression, mixed_precision
+            )
+        )
+
+    return out
+
+
+def _compute_exp_outer(omegas: np.ndarray, time: np.ndarray) -> np.ndarray:
+    r"""
+    Compute :math:`e^{\omega_i t_j}` for all continuous eigenvalues
+    and timestamps. For uniform time grids
+    :math:`t_j = t_0 + j \Delta t` the index is split
+    into :math:`j = pB + q` with :math:`B \approx \sqrt{T}`, s.t.
+    :math:`e^{\omega_i t_j} = e^{\omega_i \left(t_0 + pB\Delta t\right)}
+    e^{\omega_i q\Delta t}`. Only
+    :math:`\mathcal{O}\left(r\sqrt{T}\right)` exponentials are evaluated,
+    the remaining work are complex multiplications. The first factor is
+    the exact value at the start of each block and the second one only
+    spans a single block. Blocks whose first factor overflows are
+    evaluated directly, since the values within such a block may still
+    be finite.
+
+    :param omegas: Continuous eigenvalues :math:`\omega \in \mathbb{C}^r`.
+    :type omegas: np.ndarray
+    :param time: 1d array of timestamps :math:`t \in \mathbb{R}^T`.
+    :type time: np.ndarray
+    :return: Matrix :math:`\boldsymbol{E} \in \mathbb{C}^{r \times T}`.
+    :rtype: np.ndarray
+    """
+
+    n_time = time.shape[-1]
+    out = np.empty((omegas.shape[-1], n_time), dtype=np.complex128)
+    dt = (time[-1] - time[0]) / (n_time - 1) if n_time > 1 else 0.0
+    n_block = int(np.ceil(np.sqrt(n_time)))
+
+    if n_block < 4 or not np.allclose(
+        time, time[0] + dt * np.arange(n_time), rtol=1e-12, atol=0.0
+    ):
+        np.multiply(omegas[:, None], time[None], out=out)
+        np.exp(out, out=out)
+        return out
+
+    n_outer = n_time // n_block
+    inner = np.exp(omegas[:, None] * (dt * np.arange(n_block)))
+    outer = np.exp(
+        omegas[:, None] * (time[0] + dt * n_block * np.arange(n_outer + 1))
+    )
+
+    if not np.all(np.isfinite(inner)):
+        np.multiply(omegas[:, None], time[None], out=out)
+        np.exp(out, out=out)
+        return out
+
+    # full blocks, (r x T) is viewed as (r x n_outer x n_block)
+    np.multiply(
+        outer[:, :n_outer, None],
+        inner[:, None],
+        out=out[:, : n_outer * n_block].reshape(
+            (omegas.shape[-1], n_outer, n_block)
+        ),
+    )
+
+    # remaining (partial) block
+    n_rest = n_time - n_outer * n_block
+    np.multiply(
+        outer[:, n_outer, None],
+        inner[:, :n_rest],
+        out=out[:, n_time - n_rest :],
+    )
+
+    for row, block in zip(*np.nonzero(~np.isfinite(outer))):
+        idx = slice(block * n_block, min((block + 1) * n_block, n_time))
+        out[row, idx] = np.exp(omegas[row] * time[idx])
+    return out
+
+
 def varprodmd_predict(
     phi: np.ndarray,
     omegas: np.ndarray,
@@ -449,7 +936,9 @@ def varprodmd_predict(
     :rtype: np.ndarray
     """
 
-    return phi @ (np.exp(np.outer(omegas, time)) * eigenf[:, None])
+    dynamics = _compute_exp_outer(omegas, time)
+    dynamics *= eigenf[:, None]
+    return phi @ dynamics
 
 
 class VarProOperator(DMDOperator):
@@ -464,6 +953,7 @@ class VarProOperator(DMDOperator):
         sorted_eigs: Union[bool, str],
         compression: float,
         optargs: Dict[str, Any],
+        mixed_precision: bool = False,
     ):
         r"""
         VarProOperator constructor.
@@ -515,14 +1005,20 @@ class VarProOperator(DMDOperator):
         :param optargs: Arguments for 'least_squares' optimizer.
             Use `OPT_DEF_ARGS` as starting point.
         :type optargs: Dict[str, Any]
+        :param mixed_precision: Perform the bulk of the optimization
+            in single precision and refine the result in double precision.
+            Defaults to False.
+        :type mixed_precision: bool, optional
         """
 
         super().__init__(svd_rank, exact, False, None, sorted_eigs, False)
         self._sorted_eigs = sorted_eigs
         self._svd_rank = svd_rank
         self._exact = exact
-        self._optargs: Dict[str, Any] = optargs
+        # private copy, later changes of the caller's dict have no effect
+        self._optargs: Dict[str, Any] = dict(optargs)
         self._compression: float = compression
+        self._mixed_precision: bool = mixed_precision
         self._modes: np.ndarray = None
         self._eigenvalues: np.ndarray = None
 
@@ -562,6 +1058,7 @@ class VarProOperator(DMDOperator):
             self._svd_rank,
             not self._exact,
             self._compression,
+            self._mixed_precision,
         )
 
         # overwrite for lazy sorting
@@ -571,14 +1068,15 @@ class VarProOperator(DMDOperator):
 
         if isinstance(self._sorted_eigs, str):
             if self._sorted_eigs == "auto":
-                eigs_real = self._eigenvalues.real
-                eigs_imag = self._eigenvalues.imag
-                _eigs_abs = np.abs(self._eigenvalues)
-                var_real = np.var(eigs_real)
-                var_imag = np.var(eigs_imag)
-                var_abs = np.var(_eigs_abs)
-                array = np.array([var_real, var_imag, var_abs])
-                eigs_abs = (eigs_real, eigs_imag, _eigs_abs)[np.argmax(array)]
+                # rows: real parts, imaginary parts, magnitudes
+                stats = np.stack(
+                    (
+                        self._eigenvalues.real,
+                        self._eigenvalues.imag,
+                        np.abs(self._eigenvalues),
+                    )
+                )
+                eigs_abs = stats[np.argmax(stats.var(axis=1))]
 
             elif self._sorted_eigs == "real":
                 eigs_abs = np.abs(self._eigenvalues.real)
@@ -615,6 +1113,7 @@ class VarProDMD(DMDBase):
         sorted_eigs: Union[bool, str] = False,
         compression: float = 0.0,
         optargs: Dict[str, Any] = None,
+        mixed_precision: bool = False,
     ):
         r"""
         VarProDMD constructor.
@@ -668,6 +1167,10 @@ class VarProDMD(DMDBase):
             If set to None, `OPT_DEF_ARGS` are used as default parameters.
             Defaults to None.
         :type optargs: Dict[str, Any], optional
+        :param mixed_precision: If True, the optimization is performed
+            in single precision first and the result is refined
+            in double precision afterwards. Defaults to False.
+        :type mixed_precision: bool, optional
         """
 
         # super constructor not called
@@ -678,12 +1181,14 @@ class VarProDMD(DMDBase):
             optargs = OPT_DEF_ARGS
 
         self._Atilde = VarProOperator(
-            svd_rank, exact, sorted_eigs, compression, optargs
+            svd_rank, exact, sorted_eigs, compression, optargs, mixed_precision
         )
         self._optres: OptimizeResult = None
         self._snapshots_holder: Snapshots = None
         self._indices: np.ndarray = None
         self._modes_activation_bitmask_proxy = None
+        self._dynamics_cache: Tuple[np.ndarray, np.ndarray, np.ndarray] = None
+        self._ssr: float = None
 
     def fit(self, X: np.ndarray, time: np.ndarray) -> object:
         r"""
@@ -700,14 +1205,74 @@ class VarProDMD(DMDBase):
         """
 
         self._snapshots_holder = Snapshots(X)
+        # real, contiguous timestamps keep exp(omega * t) in complex128
+        time = np.ascontiguousarray(time, dtype=np.float64)
         (self._b, self._optres, self._indices) = self._Atilde.compute_operator(
             self._snapshots_holder.snapshots.astype(np.complex128), time
         )
         self._original_time = time
         self._dmd_time = time[self._indices]
+        self._dynamics_cache = None
+        # The residual of the optimum does not change after fitting,
+        # ||Re{rho} + i Im{rho}|| = ||[Re{rho}; Im{rho}]||.
+        denom = max(
+            time.size
+            - self._optres.jac.shape[0] // 2
+            - self._optres.jac.shape[1] // 2,
+            1,
+        )
+        self._ssr = np.linalg.norm(self._optres.fun) / np.sqrt(denom)
 
         return self
 
+    def fit_many(
+        self,
+        X_list: List[np.ndarray],
+        time_list: List[np.ndarray],
+        n_jobs: int = None,
+    ) -> List["VarProDMD"]:
+        r"""
+        Fit independent problems (e.g. parameter sweeps or bagging)
+        concurrently. Every problem is fitted by an own copy of this
+        (configured) instance, the instance itself remains untouched.
+        Threads are used since the bulk of the work is spent in
+        LAPACK/BLAS routines, which release the GIL.
+
+        :param X_list: Measurements
+            :math:`\boldsymbol{X}_k \in \mathbb{C}^{n_k \times m_k}`.
+        :type X_list: List[np.ndarray]
+        :param time_list: 1d arrays of timestamps where measurements
+            were taken.
+        :type time_list: List[np.ndarray]
+        :param n_jobs: Number of worker threads. If `n_jobs=-1`,
+            all processors are used. If None, the default of
+            `concurrent.futures.ThreadPoolExecutor` is used.
+            Defaults to None.
+        :type n_jobs: int, optional
+        :raises ValueError: If the number of measurements and
+            time arrays differ.
+        :return: Fitted VarProDMD instances, same order as `X_list`.
+        :rtype: List[VarProDMD]
+        """
+
+        if len(X_list) != len(time_list):
+            raise ValueError("Number of measurements and time arrays differ!")
+
+        if n_jobs == -1:
+            n_jobs = os.cpu_count()
+
+        models = [copy.deepcopy(self) for _ in X_list]
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            return list(
+                executor.map(
+                    lambda model, X, time: model.fit(X, time),
+                    models,
+                    X_list,
+                    time_list,
+                )
+            )
+
     def forecast(self, time: np.ndarray) -> np.ndarray:
         r"""
         Forecast measurements at given timestamps `time`.
@@ -743,23 +1308,7 @@ class VarProDMD(DMDBase):
         if not self.fitted:
             raise ValueError("Nothing fitted yet!")
 
-        rho_flat_real = self._optres.fun
-        rho_flat_imag = np.zeros(
-            (rho_flat_real.size // 2,), dtype=np.complex128
-        )
-        rho_flat_imag.real = rho_flat_real[: rho_flat_real.size // 2]
-        rho_flat_imag.imag = rho_flat_real[rho_flat_real.size // 2 :]
-
-        sigma = np.linalg.norm(rho_flat_imag)
-        denom = max(
-            self._original_time.size
-            - self._optres.jac.shape[0] // 2
-            - self._optres.jac.shape[1] // 2,
-            1,
-        )
-        ssr = sigma / np.sqrt(float(denom))
-
-        return ssr
+        return self._ssr
 
     @property
     def selected_samples(self) -> np.ndarray:
@@ -803,13 +1352,30 @@ class VarProDMD(DMDBase):
     def dynamics(self):
         """
         Get the time evolution of each mode.
+        The time evolution is cached internally until the model is refitted
+        or the (active) eigenvalues/amplitudes change, a (writable) copy
+        is returned.
 
         :return: matrix that contains all the time evolution, stored by row.
         :rtype: numpy.ndarray
         """
 
-        t_omega = np.exp(np.outer(self.eigs, self._original_time))
-        return self.amplitudes[:, None] * t_omega
+        eigs = self.eigs
+        amplitudes = self.amplitudes
+
+        if self._dynamics_cache is not None:
+            cached_eigs, cached_amplitudes, dynamics = self._dynamics_cache
+            if np.array_equal(cached_eigs, eigs) and np.array_equal(
+                cached_amplitudes, amplitudes
+            ):
+                return dynamics.copy()
+
+        dynamics = _compute_exp_outer(eigs, self._original_time)
+        dynamics *= amplitudes[:, None]
+        dynamics.flags.writeable = False
+
+        self._dynamics_cache = (eigs.copy(), amplitudes.copy(), dynamics)
+        return dynamics.copy()
 
     @property
     def frequency(self):
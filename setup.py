@@ -24,7 +24,14 @@ REQUIRED = [
 
 EXTRAS = {
     "docs": ["Sphinx>=1.4", "sphinx_rtd_theme"],
-    "test": ["pytest", "pytest-cov", "pytest-mock", "ezyrb>=v1.2.1.post2205"],
+    "test": [
+        "pytest",
+        "pytest-cov",
+        "pytest-mock",
+        "pytest-xdist",
+        "threadpoolctl",
+        "ezyrb>=v1.2.1.post2205",
+    ],
 }
 
 LDESCRIPTION = (
@@ -0,0 +1,114 @@
+"""
+Shared test fixtures.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+# Keeps the BLAS/OpenMP thread limit of this (xdist) worker alive.
+_THREADPOOL_LIMITS = []
+
+
+def pytest_configure(config):
+    """
+    When the tests run in parallel with pytest-xdist (``pytest -n auto``),
+    limit the BLAS/OpenMP threads of each worker to its share of the cores,
+    s.t. concurrent LAPACK calls do not oversubscribe the machine.
+    """
+    n_workers = os.environ.get("PYTEST_XDIST_WORKER_COUNT")
+    if n_workers is None:
+        return
+    # only needed (and installed with the test extra) for parallel runs
+    from threadpoolctl import threadpool_limits
+
+    n_threads = max(1, (os.cpu_count() or 1) // int(n_workers))
+    _THREADPOOL_LIMITS.append(threadpool_limits(limits=n_threads))
+
+
+# Initial state of the Lorenz test data. Increase the version whenever the
+# data generation changes, s.t. persisted pytest caches are not reused.
+LORENZ_X0 = (-8.0, 8.0, 27.0)
+LORENZ_VERSION = 1
+
+
+def generate_lorenz_data(t_eval):
+    """
+    Given a uniform time vector t_eval = t1, t2, ..., evaluates and returns
+    the snapshots of the Lorenz system as columns of the matrix X.
+    Uses a classical fixed-step Runge-Kutta (RK4) scheme with the time step
+    of t_eval, which is much cheaper than an adaptive integrator with
+    tight tolerances and accurate enough for the (chaotic) test data.
+    """
+
+    sigma, rho, beta = 10.0, 28.0, 8.0 / 3.0  # chaotic parameters
+
+    def lorenz_system(x, y, z):
+        return sigma * (y - x), (x * (rho - z)) - y, (x * y) - (beta * z)
+
+    dt = float(t_eval[1] - t_eval[0])
+    X = np.empty((3, len(t_eval)))
+    x, y, z = X[:, 0] = LORENZ_X0
+
+    # plain floats, scalar NumPy operations are much slower
+    for i in range(1, len(t_eval)):
+        k1 = lorenz_system(x, y, z)
+        k2 = lorenz_system(
+            x + 0.5 * dt * k1[0], y + 0.5 * dt * k1[1], z + 0.5 * dt * k1[2]
+        )
+        k3 = lorenz_system(
+            x + 0.5 * dt * k2[0], y + 0.5 * dt * k2[1], z + 0.5 * dt * k2[2]
+        )
+        k4 = lorenz_system(x + dt * k3[0], y + dt * k3[1], z + dt * k3[2])
+        x += dt / 6.0 * (k1[0] + 2.0 * (k2[0] + k3[0]) + k4[0])
+        y += dt / 6.0 * (k1[1] + 2.0 * (k2[1] + k3[1]) + k4[1])
+        z += dt / 6.0 * (k1[2] + 2.0 * (k2[2] + k3[2]) + k4[2])
+        X[:, i] = x, y, z
+
+    return X
+
+
+def _cached_lorenz_data(config, m, dt=0.001):
+    """
+    Lorenz system data for the time vector np.arange(m) * dt. The data is
+    stored in the pytest cache directory, s.t. it is generated only once
+    (use --cache-clear to regenerate) and shared between (xdist) workers.
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return generate_lorenz_data(np.arange(m) * dt)
+
+    x0 = "_".join(map(str, LORENZ_X0))
+    path = (
+        cache.mkdir("lorenz")
+        / f"lorenz_rk4_v{LORENZ_VERSION}_{x0}_{m}_{dt}.npy"
+    )
+    if not path.exists():
+        X = generate_lorenz_data(np.arange(m) * dt)
+        # write to a temporary file first, concurrent workers
+        # must never load a partially written file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as file:
+            np.save(file, X)
+        tmp_path.replace(path)
+        return X
+
+    return np.load(path, mmap_mode="r")
+
+
+@pytest.fixture(scope="session")
+def lorenz_data_long(pytestconfig):
+    """
+    Lorenz system snapshots (3 x 100000) for t = np.arange(100000) * 0.001.
+    """
+    return _cached_lorenz_data(pytestconfig, 100000)
+
+
+@pytest.fixture(scope="session")
+def lorenz_data(lorenz_data_long):
+    """
+    Lorenz system snapshots (3 x 50000) for t = np.arange(50000) * 0.001,
+    i.e. the first half of the long trajectory.
+    """
+    return lorenz_data_long[:, :50000]
@@ -147,6 +147,19 @@ def test_reconstruction():
     bopdmd.fit(Z, t)
     np.testing.assert_allclose(bopdmd.reconstructed_data, Z, rtol=1e-5)
 
+    # The dynamics are cached until the amplitudes change,
+    # writable copies are returned.
+    expected_dynamics = bopdmd.amplitudes[:, None] * np.exp(
+        np.outer(bopdmd.eigs, t)
+    )
+    dynamics = bopdmd.dynamics
+    np.testing.assert_allclose(dynamics, expected_dynamics)
+    assert dynamics.flags.writeable
+    dynamics /= bopdmd.amplitudes[:, None]
+    np.testing.assert_allclose(bopdmd.dynamics, expected_dynamics)
+    bopdmd.modes_activation_bitmask = np.array([True, False])
+    assert bopdmd.dynamics.shape == (1, len(t))
+
     bopdmd = BOPDMD(svd_rank=2, num_trials=10, trial_size=0.8)
     bopdmd.fit(Z, t)
     np.testing.assert_allclose(bopdmd.reconstructed_data, Z, rtol=1e-5)
@@ -571,27 +571,27 @@ def test_sorted_eigs_amplitudes():
                 break
 
 
-def test_save():
+def test_save(tmp_path):
     dmd = DMD(svd_rank=-1)
     dmd.fit(X=sample_data)
-    dmd.save("pydmd.test")
+    dmd.save(tmp_path / "pydmd.test")
 
 
-def test_load():
+def test_load(tmp_path):
     dmd = DMD(svd_rank=-1)
     dmd.fit(X=sample_data)
-    dmd.save("pydmd.test2")
-    loaded_dmd = DMD.load("pydmd.test2")
+    dmd.save(tmp_path / "pydmd.test2")
+    loaded_dmd = DMD.load(tmp_path / "pydmd.test2")
     np.testing.assert_array_equal(
         dmd.reconstructed_data, loaded_dmd.reconstructed_data
     )
 
 
-def test_load():
+def test_load(tmp_path):
     dmd = DMD(svd_rank=-1)
     dmd.fit(X=sample_data)
-    dmd.save("pydmd.test2")
-    loaded_dmd = DMD.load("pydmd.test2")
+    dmd.save(tmp_path / "pydmd.test2")
+    loaded_dmd = DMD.load(tmp_path / "pydmd.test2")
     assert isinstance(loaded_dmd, DMD)
 
 
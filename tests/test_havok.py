@@ -1,53 +1,55 @@
 import warnings
 import numpy as np
-from pytest import raises
-from scipy.integrate import solve_ivp
+from pytest import fixture, raises
 from numpy.testing import assert_equal
 
 from pydmd import DMD
 from pydmd import PiDMD
 from pydmd import HAVOK
+from pydmd.utils import compute_svd
 
 warnings.filterwarnings("ignore")
 
 
-def generate_lorenz_data(t_eval):
+# Lorenz system data (see conftest.py), time step and number of samples.
+dt = 0.001  # time step
+m = 50000  # number of data samples
+t = np.arange(m) * dt
+
+
+@fixture(scope="module", name="X")
+def fixture_X(lorenz_data):
     """
-    Given a time vector t_eval = t1, t2, ..., evaluates and returns
-    the snapshots of the Lorenz system as columns of the matrix X.
+    Snapshots of the Lorenz system.
     """
+    return lorenz_data
 
-    def lorenz_system(state_t, state):
-        sigma, rho, beta = 10, 28, 8 / 3  # chaotic parameters
-        x, y, z = state
-        x_dot = sigma * (y - x)
-        y_dot = (x * (rho - z)) - y
-        z_dot = (x * y) - (beta * z)
-        return [x_dot, y_dot, z_dot]
 
-    # Set integrator keywords to replicate the odeint defaults
-    integrator_keywords = {}
-    integrator_keywords["rtol"] = 1e-12
-    integrator_keywords["atol"] = 1e-12
-    integrator_keywords["method"] = "LSODA"
+@fixture(scope="module", name="x")
+def fixture_x(lorenz_data):
+    """
+    x-coordinate of the Lorenz system.
+    """
+    return lorenz_data[0]
 
-    sol = solve_ivp(
-        lorenz_system,
-        [t_eval[0], t_eval[-1]],
-        [-8, 8, 27],
-        t_eval=t_eval,
-        **integrator_keywords,
-    )
 
-    return sol.y
+# Fitting is the expensive part of most tests. Models that are fitted
+# with identical parameters are shared by all tests of this module.
+# The tests must not modify these models.
+@fixture(scope="module", name="havok_default")
+def fixture_havok_default(x):
+    """
+    HAVOK model with default parameters, fitted to x.
+    """
+    return HAVOK().fit(x, t)
 
 
-# Generate Lorenz system data.
-dt = 0.001  # time step
-m = 50000  # number of data samples
-t = np.arange(m) * dt
-X = generate_lorenz_data(t)
-x = X[0]
+@fixture(scope="module", name="havok_16")
+def fixture_havok_16(x):
+    """
+    HAVOK model with svd_rank=16 and delays=100, fitted to x.
+    """
+    return HAVOK(svd_rank=16, delays=100).fit(x, t)
 
 
 def test_error_fitted():
@@ -161,13 +163,12 @@ def test_hankel_3():
         havok.hankel(dummy_data)
 
 
-def test_shape_1():
+def test_shape_1(havok_default):
     """
     Using the default HAVOK parameters, checks that the shapes of
     linear_embeddings, forcing_input, A, and B are accurate.
     """
-    havok = HAVOK()
-    havok.fit(x, t)
+    havok = havok_default
     time_length = len(t) - havok.delays + 1
     assert havok.linear_dynamics.shape == (time_length, havok.r - 1)
     assert havok.forcing.shape == (time_length, 1)
@@ -175,7 +176,7 @@ def test_shape_1():
     assert havok.B.shape == (havok.r - 1, 1)
 
 
-def test_shape_2():
+def test_shape_2(x):
     """
     Using num_chaos = 2, checks that the shapes of
     linear_embeddings, forcing_input, A, and B are accurate.
@@ -189,7 +190,7 @@ def test_shape_2():
     assert havok.B.shape == (havok.r - 2, 2)
 
 
-def test_snapshots_1():
+def test_snapshots_1(x, havok_default):
     """
     Test the stored snapshots and ho_snapshots.
     Ensure that they are accurate in the default case with 1-D data.
@@ -199,12 +200,12 @@ def test_snapshots_1():
         _ = havok.snapshots
     with raises(ValueError):
         _ = havok.ho_snapshots
-    havok.fit(x, t)
+    havok = havok_default
     assert_equal(havok.snapshots, x)
     assert_equal(havok.ho_snapshots, havok.hankel(x))
 
 
-def test_snapshots_2():
+def test_snapshots_2(X):
     """
     Test the stored snapshots and ho_snapshots.
     Ensure that they are accurate in the default case with 2-D data.
@@ -214,7 +215,29 @@ def test_snapshots_2():
     assert_equal(havok.ho_snapshots, havok.hankel(X))
 
 
-def test_time_1():
+def test_hankel_svd(X):
+    """
+    Test the SVD of large Hankel matrices with few singular values.
+    Ensure that the FFT-based Hankel operator and its truncated SVD agree
+    with the explicitly built Hankel matrix.
+    """
+    havok = HAVOK(svd_rank=8, delays=100, lag=2)
+    H = havok.hankel(X)
+    hankel_op = havok._hankel_operator(X)
+    v = np.linspace(-1.0, 1.0, H.shape[1])
+    u = np.linspace(-1.0, 1.0, H.shape[0])
+    np.testing.assert_allclose(hankel_op.matvec(v), H @ v, atol=1e-8)
+    np.testing.assert_allclose(hankel_op.rmatvec(u), H.T @ u, atol=1e-8)
+
+    U, s, V = havok._compute_hankel_svd(X, 8)
+    U_true, s_true, V_true = compute_svd(H, 8)
+    np.testing.assert_allclose(s, s_true, rtol=1e-10)
+    np.testing.assert_allclose(
+        (U * s) @ V.T, (U_true * s_true) @ V_true.T, atol=1e-8
+    )
+
+
+def test_time_1(havok_default):
     """
     Test the stored time attribute.
     Ensure that it is accurate in the default case.
@@ -222,39 +245,36 @@ def test_time_1():
     havok = HAVOK()
     with raises(ValueError):
         _ = havok.time
-    havok.fit(x, t)
-    assert_equal(havok.time, t)
+    assert_equal(havok_default.time, t)
 
 
-def test_time_2():
+def test_time_2(x, havok_default):
     """
     Test that a HAVOK model fitted with a time vector is essentially
     the same as a HAVOK model fitted with the time-step dt. Check the
     stored time vector and the computed HAVOK operator.
     """
-    havok_1 = HAVOK().fit(x, t)
+    havok_1 = havok_default
     havok_2 = HAVOK().fit(x, dt)
     assert_equal(havok_1.time, havok_2.time)
     assert_equal(havok_1.operator, havok_2.operator)
 
 
-def test_plot_summary_1():
+def test_plot_summary_1(havok_16):
     """
     Test that everything is fine if we fit a HAVOK
     model and ask for the default summary plot.
     """
-    havok = HAVOK(svd_rank=16, delays=100)
-    havok.fit(x, t)
+    havok = havok_16
     havok.plot_summary()
 
 
-def test_plot_summary_2():
+def test_plot_summary_2(havok_16):
     """
     Test that everything is fine if we fit a HAVOK model and
     ask for various (but still valid) plot modifications.
     """
-    havok = HAVOK(svd_rank=16, delays=100)
-    havok.fit(x, t)
+    havok = havok_16
     havok.plot_summary(
         num_plot=15000,
         index_linear=(0, 1),
@@ -275,16 +295,16 @@ def test_plot_summary_3():
         havok.plot_summary()
 
 
-def test_reconstruction_1():
+def test_reconstruction_1(x, havok_16):
     """
     Test the accuracy of the HAVOK reconstruction.
     """
-    havok = HAVOK(svd_rank=16, delays=100).fit(x, t)
+    havok = havok_16
     error = x - havok.reconstructed_data
     assert np.linalg.norm(error) / np.linalg.norm(x) < 0.4
 
 
-def test_reconstruction_2():
+def test_reconstruction_2(x):
     """
     Test the accuracy of the sHAVOK reconstruction.
     """
@@ -293,29 +313,43 @@ def test_reconstruction_2():
     assert np.linalg.norm(error) / np.linalg.norm(x[:-1]) < 0.4
 
 
-def test_predict_1():
+def test_reconstruction_3(x):
+    """
+    Test the accuracy of the sHAVOK reconstruction.
+    Ensure that sHAVOK is accurate if the truncated SVDs of the
+    Hankel matrices are computed iteratively (many delays, integer rank).
+    """
+    x_short = x[:20000]
+    havok = HAVOK(svd_rank=10, delays=300, structured=True)
+    havok.fit(x_short, t[:20000])
+    error = x_short[:-1] - havok.reconstructed_data
+    assert np.linalg.norm(error) / np.linalg.norm(x_short[:-1]) < 0.4
+    assert np.all(np.abs(havok.eigs) < 1 / dt)
+
+
+def test_predict_1(havok_16):
     """
     Test the accuracy of the HAVOK prediction.
     Ensure that prediction with the HAVOK forcing term and the times
     of fitting simply yields the computed data reconstruction.
     """
-    havok = HAVOK(svd_rank=16, delays=100).fit(x, t)
+    havok = havok_16
     assert_equal(
         havok.predict(havok.forcing, havok.time[: len(havok.forcing)]),
         havok.reconstructed_data,
     )
 
 
-def test_predict_2():
+def test_predict_2(lorenz_data_long, havok_16):
     """
     Test the accuracy of the HAVOK prediction.
     Test that predicting beyond the training set isn't absurdly inaccurate.
     """
-    havok = HAVOK(svd_rank=16, delays=100).fit(x, t)
+    havok = havok_16
 
     # Build a longer data set and fit a HAVOK model to it.
     t_long = np.arange(2 * m) * dt
-    x_long = generate_lorenz_data(t_long)[0]
+    x_long = lorenz_data_long[0]
     havok_long = HAVOK(svd_rank=16, delays=100).fit(x_long, t_long)
 
     # We only use the long HAVOK model to obtain a long forcing signal.
@@ -327,13 +361,13 @@ def test_predict_2():
     assert np.linalg.norm(error) / np.linalg.norm(x_long) < 1.0
 
 
-def test_predict_3():
+def test_predict_3(havok_16):
     """
     Test the accuracy of the HAVOK prediction.
     Test that predicting with V0 indices is functionally
     the same as predicting with array-valued V0 inputs.
     """
-    havok = HAVOK(svd_rank=16, delays=100).fit(x, t)
+    havok = havok_16
     t_forcing = havok.time[: len(havok.forcing)]
     assert_equal(
         havok.predict(havok.forcing, t_forcing, V0=0),
@@ -349,24 +383,24 @@ def test_predict_3():
     )
 
 
-def test_threshold_1():
+def test_threshold_1(havok_16):
     """
     Test compute_threshold function.
     Test that threshold computation works as expected, whether you plot or not.
     """
-    havok = HAVOK(svd_rank=16, delays=100).fit(x, t)
+    havok = havok_16
     thres_1 = havok.compute_threshold(p=0.1, bins=100, plot=False)
     thres_2 = havok.compute_threshold(p=0.1, bins=100, plot=True)
     assert thres_1 == thres_2
 
 
-def test_threshold_2():
+def test_threshold_2(havok_16):
     """
     Test compute_threshold function.
     Test that threshold computation works as expected, whether you index
     the stored forcing term, or provide a custom array-valued forcing term.
     """
-    havok = HAVOK(svd_rank=16, delays=100).fit(x, t)
+    havok = havok_16
     vr = havok.forcing.flatten()
     thres_1 = havok.compute_threshold(p=0.1, bins=100)
     thres_2 = havok.compute_threshold(forcing=vr, p=0.1, bins=100)
@@ -384,7 +418,7 @@ def test_threshold_3():
         _ = havok.compute_threshold()
 
 
-def test_dmd_1():
+def test_dmd_1(x):
     """
     Test that HAVOK works when used with an externally-defined DMD model.
     Test the basic exact DMD model - ensure that plot_summary works just
@@ -397,7 +431,7 @@ def test_dmd_1():
     assert np.linalg.norm(error) / np.linalg.norm(x) < 0.4
 
 
-def test_dmd_2():
+def test_dmd_2(x):
     """
     Test that HAVOK works when used with an externally-defined DMD model.
     Test a physics-informed DMD model - ensure that plot_summary works just
@@ -1,5 +1,4 @@
 import glob
-import os
 import numpy as np
 from scipy.integrate import solve_ivp
 import scipy
@@ -286,13 +285,13 @@ def test_omega_transforms():
         )
 
 
-def test_netcdf():
+def test_netcdf(tmp_path):
     """
     Test the round trip conversion of the mrCOSTS object to file in
     netcdf format and back to mrCOSTS.
     """
-    mrc.to_netcdf("tests")
-    file_list = glob.glob("*tests*.nc")
+    mrc.to_netcdf(str(tmp_path / "tests"))
+    file_list = glob.glob(str(tmp_path / "*tests*.nc"))
     mrc_from_file = mrCOSTS()
     mrc_from_file.from_netcdf(file_list)
 
@@ -358,10 +357,3 @@ def test_plot_local_time_series():
 
     with raises(ValueError):
         _ = mrc.plot_local_time_series(0, 0, data=data.T)
-
-
-def tear_down():
-    """Remove the files generated in `test_netcdf`"""
-    file_list = glob.glob("*tests*.nc")
-    for f in file_list:
-        os.remove(f)
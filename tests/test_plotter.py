@@ -1,5 +1,3 @@
-import os
-
 import matplotlib.pyplot as plt
 import numpy as np
 from pytest import raises
@@ -102,11 +100,12 @@ def test_plot_eigs_2():
     plt.close()
 
 
-def test_plot_eigs_3():
+def test_plot_eigs_3(tmp_path):
     dmd = DMD()
     dmd.fit(X=sample_data)
-    plot_eigs(dmd, show_axes=False, show_unit_circle=True, filename="eigs.png")
-    os.remove("eigs.png")
+    filename = tmp_path / "eigs.png"
+    plot_eigs(dmd, show_axes=False, show_unit_circle=True, filename=filename)
+    assert filename.exists()
 
 
 def test_plot_modes_1():
@@ -139,14 +138,17 @@ def test_plot_modes_4():
     plt.close()
 
 
-def test_plot_modes_5():
+def test_plot_modes_5(tmp_path):
     dmd = DMD()
     snapshots = [snap.reshape(20, 20) for snap in sample_data.T]
     dmd.fit(X=snapshots)
     plot_modes_2D(
-        dmd, snapshots_shape=(20, 20), index_mode=1, filename="tmp.png"
+        dmd,
+        snapshots_shape=(20, 20),
+        index_mode=1,
+        filename=str(tmp_path / "tmp.png"),
     )
-    os.remove("tmp.1.png")
+    assert (tmp_path / "tmp.1.png").exists()
 
 
 def test_plot_snapshots_1():
@@ -179,14 +181,17 @@ def test_plot_snapshots_4():
     plt.close()
 
 
-def test_plot_snapshots_5():
+def test_plot_snapshots_5(tmp_path):
     dmd = DMD()
     snapshots = [snap.reshape(20, 20) for snap in sample_data.T]
     dmd.fit(X=snapshots)
     plot_snapshots_2D(
-        dmd, snapshots_shape=(20, 20), index_snap=2, filename="tmp.png"
+        dmd,
+        snapshots_shape=(20, 20),
+        index_snap=2,
+        filename=str(tmp_path / "tmp.png"),
     )
-    os.remove("tmp.2.png")
+    assert (tmp_path / "tmp.2.png").exists()
 
 
 def test_tdmd_plot():
@@ -273,9 +278,10 @@ def test_plot_summary_4():
     plt.close()
 
 
-def test_plot_summary_5():
+def test_plot_summary_5(tmp_path):
     # Test 5: Everything is fine when saving the plot.
     dmd = DMD()
     dmd.fit(X=sample_data)
-    plot_summary(dmd, snapshots_shape=(20, 20), filename="tmp.png")
-    os.remove("tmp.png")
+    filename = tmp_path / "tmp.png"
+    plot_summary(dmd, snapshots_shape=(20, 20), filename=filename)
+    assert filename.exists()
@@ -4,14 +4,21 @@ Test module for VarProDMD
 
 import numpy as np
 import pytest
+from scipy.linalg import qr
 
+import pydmd.utils
+import pydmd.varprodmd
 from pydmd import VarProDMD
 from pydmd.varprodmd import (
     OPT_DEF_ARGS,
     _compute_dmd_jac,
+    _compute_dmd_jac_op,
+    _compute_exp_outer,
     _compute_dmd_rho,
     _OptimizeHelper,
+    _varpro_preprocessing,
     compute_varprodmd_any,
+    compute_varprodmd_batch,
     varprodmd_predict,
     select_best_samples_fast,
 )
@@ -32,6 +39,28 @@ def signal(x_loc: np.ndarray, time: np.ndarray) -> np.ndarray:
     return f_1 + f_2
 
 
+@pytest.fixture(scope="module")
+def snapshots():
+    """
+    Spatiotemporal test signal (1024 x 100) and its timestamps,
+    read-only since they are shared by the tests of this module.
+    """
+    time = np.linspace(0, 4 * np.pi, 100)
+    x_loc = np.linspace(-10, 10, 1024)
+    z = signal(*np.meshgrid(x_loc, time)).T
+    z.flags.writeable = time.flags.writeable = False
+    return z, time
+
+
+@pytest.fixture(scope="module")
+def reference_dmd(snapshots):
+    """
+    VarProDMD with default settings fitted on the test signal.
+    """
+    z, time = snapshots
+    return VarProDMD(0, False, False, 0).fit(z, time)
+
+
 def test_varprodmd_rho():
     """
     Unit test for residual vector :math: `\boldsymbol{\rho}`.
@@ -63,6 +92,39 @@ def test_varprodmd_rho():
     assert np.array_equal(phi, opthelper.phi)
 
 
+def test_varprodmd_rho_qr():
+    """
+    Unit test for residual vector :math: `\boldsymbol{\rho}`
+    if :math:`\boldsymbol{\Phi}` has full column rank (QR instead of SVD).
+    """
+    rng = np.random.default_rng(seed=1234)
+    data = rng.normal(size=(10, 3)) + 1j * rng.normal(size=(10, 3))
+    time = np.linspace(0.0, 1.0, 10)
+    alphas = np.array([-1.0 + 1j, 0.5 - 2j], np.complex128)
+    alphas_in = np.concatenate([alphas.real, alphas.imag])
+    phi = np.exp(np.outer(time, alphas))
+    phi_inv = np.linalg.pinv(phi)
+    res_flat = np.ravel(data - phi @ phi_inv @ data)
+
+    opthelper = _OptimizeHelper(2, *data.shape)
+    rho_flat_out = _compute_dmd_rho(alphas_in, time, data, opthelper)
+
+    assert np.allclose(
+        rho_flat_out, np.concatenate([res_flat.real, res_flat.imag])
+    )
+    assert np.allclose(opthelper.phi_inv, phi_inv)
+    assert np.allclose(opthelper.b_matrix, phi_inv @ data)
+    assert np.allclose(
+        opthelper.u_svd @ opthelper.u_svd.conj().T, phi @ phi_inv
+    )
+    assert np.array_equal(phi, opthelper.phi)
+
+    # same parameters, cached residual
+    assert _compute_dmd_rho(alphas_in, time, data, opthelper) is rho_flat_out
+    rho_flat_neg = _compute_dmd_rho(-alphas_in, time, data, opthelper)
+    assert rho_flat_neg is not rho_flat_out
+
+
 def test_varprodmd_jac():  # pylint: disable=too-many-locals,too-many-statements
     """
     Test Jacobian computation (real vs. complex).
@@ -155,6 +217,62 @@ def test_varprodmd_jac():  # pylint: disable=too-many-locals,too-many-statements
     assert np.linalg.norm(GRAD_IMAG - rec_grad) < 1e-9
 
 
+def test_varprodmd_jac_op():
+    """
+    Test Jacobian linear operator against the dense Jacobian.
+    """
+    rng = np.random.default_rng(seed=1234)
+    time = np.linspace(0.0, 1.0, 9)
+    alphas_in = np.array([-1.0, -0.5, 0.1, 2.0, -3.0, 0.5], np.float64)
+    data = rng.normal(size=(9, 4)) + 1j * rng.normal(size=(9, 4))
+
+    opthelper = _OptimizeHelper(3, *data.shape)
+    _compute_dmd_rho(alphas_in, time, data, opthelper)
+    JAC_OUT_REAL = _compute_dmd_jac(alphas_in, time, data, opthelper)
+    JAC_OP = _compute_dmd_jac_op(alphas_in, time, data, opthelper)
+
+    assert JAC_OP.shape == JAC_OUT_REAL.shape
+
+    x_in = rng.normal(size=JAC_OP.shape[-1])
+    y_in = rng.normal(size=JAC_OP.shape[0])
+
+    assert np.linalg.norm(JAC_OP.matvec(x_in) - JAC_OUT_REAL @ x_in) < 1e-12
+    assert np.linalg.norm(JAC_OP.rmatvec(y_in) - JAC_OUT_REAL.T @ y_in) < 1e-12
+
+
+def test_varprodmd_exp_outer():
+    """
+    Test blocked evaluation of the exponentials for uniform time grids.
+    """
+    omegas = np.array([-0.1 + 2.3j, 0.05 - 2.8j, 1j], np.complex128)
+
+    for time in (
+        np.linspace(0, 4 * np.pi, 1000),
+        np.arange(3, 103) * 0.1,
+        np.linspace(0, 1, 3),
+        np.sort(np.random.default_rng(seed=1234).uniform(0, 10, 500)),
+    ):
+        assert np.allclose(
+            _compute_exp_outer(omegas, time),
+            np.exp(np.outer(omegas, time)),
+            rtol=1e-12,
+        )
+
+    # centred grids with strong decay, the exact values span
+    # (almost) the whole floating point range
+    for omega, time in (
+        (-20 + 1j, np.linspace(-40, 40, 10001)),
+        (-2 + 1j, np.linspace(-200, 200, 10001)),
+    ):
+        omegas = np.array([omega])
+        with np.errstate(over="ignore", invalid="ignore"):
+            expected = np.exp(np.outer(omegas, time))
+            result = _compute_exp_outer(omegas, time)
+        finite = np.isfinite(expected)
+        assert np.all(np.isfinite(result) == finite)
+        assert np.allclose(result[finite], expected[finite], rtol=1e-10)
+
+
 def test_varprodmd_any():
     """
     Test Variable Projection function for DMD (at any timestep).
@@ -165,6 +283,7 @@ def test_varprodmd_any():
     z = signal(*np.meshgrid(x_loc, time)).T
 
     idx = select_best_samples_fast(z, 0.6)
+    assert np.array_equal(idx, qr(z, pivoting=True)[-1][: idx.size])
 
     z_sub = z[:, idx]
     t_sub = time[idx]
@@ -200,6 +319,78 @@ def test_varprodmd_any():
 
     assert mae < 1.0
 
+    optargs = dict(OPT_DEF_ARGS, tr_solver="lsmr")
+    phi, lambdas, eigenf, _, opt = compute_varprodmd_any(
+        z_sub, t_sub, optargs, rank=0.0
+    )
+    pred = varprodmd_predict(phi, lambdas, eigenf, time)
+    diff = np.abs(pred - z)
+    mae = np.sum(np.sum(diff, axis=0), axis=-1) / z.shape[0] / z.shape[-1]
+
+    assert not isinstance(opt.jac, np.ndarray)
+    assert mae < 1.0
+
+    # small integer rank, randomized SVD
+    phi, lambdas, eigenf, _, _ = compute_varprodmd_any(
+        z_sub, t_sub, OPT_DEF_ARGS, rank=2
+    )
+    pred = varprodmd_predict(phi, lambdas, eigenf, time)
+    diff = np.abs(pred - z)
+    mae = np.sum(np.sum(diff, axis=0), axis=-1) / z.shape[0] / z.shape[-1]
+
+    assert mae < 1.0
+    assert np.allclose(np.sort(lambdas.imag), [2.3, 2.8])
+
+
+def test_varprodmd_randomized_svd(mocker, snapshots):
+    """
+    Test that the randomized SVD for small ranks
+    never decomposes the full data matrix.
+    """
+    z, time = snapshots
+
+    spy_rank = mocker.spy(pydmd.utils, "compute_rank")
+    spy_svd = mocker.spy(pydmd.varprodmd, "compute_svd")
+    _, _, data_proj, u_r = _varpro_preprocessing(z, time, rank=2)
+
+    spy_rank.assert_not_called()
+    assert spy_svd.call_count == 1
+    assert spy_svd.call_args.args[0].shape == (2 + 10, 100)
+
+    u_true, s_true, _ = np.linalg.svd(z, full_matrices=False)
+    assert u_r.shape == (1024, 2)
+    assert data_proj.shape == (2, 100)
+    assert np.allclose(np.linalg.svd(data_proj, compute_uv=False), s_true[:2])
+    assert np.allclose(np.abs(u_r.conj().T @ u_true[:, :2]), np.eye(2))
+
+
+def test_varprodmd_batch():
+    """
+    Test batched Variable Projection against the single problem function.
+    """
+    time = np.linspace(0, 4 * np.pi, 100)
+    x_loc = np.linspace(-10, 10, 256)
+    z = signal(*np.meshgrid(x_loc, time)).T
+    z_batch = np.stack([z[:, :50], z[:, 50:]])
+    t_batch = np.stack([time[:50], time[50:]])
+
+    with pytest.raises(ValueError):
+        compute_varprodmd_batch(z, time, OPT_DEF_ARGS)
+
+    with pytest.raises(ValueError):
+        compute_varprodmd_batch(z_batch, time, OPT_DEF_ARGS)
+
+    results = compute_varprodmd_batch(z_batch, t_batch, OPT_DEF_ARGS)
+    assert len(results) == 2
+
+    for res, z_sub, t_sub in zip(results, z_batch, t_batch):
+        phi, lambdas, eigenf, _, _ = res
+        ref = compute_varprodmd_any(z_sub, t_sub, OPT_DEF_ARGS)
+        assert np.allclose(np.sort_complex(lambdas), np.sort_complex(ref[1]))
+
+        pred = varprodmd_predict(phi, lambdas, eigenf, t_sub)
+        assert np.abs(pred - z_sub).mean() < 1e-6
+
 
 def test_varprodmd_class():
     """
@@ -229,6 +420,17 @@ def test_varprodmd_class():
     assert len(dmd.modes.shape) == 2
     assert dmd.amplitudes.size > 0
     assert len(dmd.dynamics.shape) == 2
+    expected_dynamics = dmd.amplitudes[:, None] * np.exp(
+        np.outer(dmd.eigs, time)
+    )
+    assert np.allclose(dmd.dynamics, expected_dynamics)
+
+    # cached dynamics are returned as writable copies
+    dynamics = dmd.dynamics
+    assert dynamics.flags.writeable
+    assert dynamics is not dmd.dynamics
+    dynamics /= dmd.amplitudes[:, None]
+    assert np.allclose(dmd.dynamics, expected_dynamics)
     assert dmd.amplitudes.size == dmd.frequency.size
     assert dmd.growth_rate.size == dmd.amplitudes.size
     assert dmd.eigs.size == dmd.amplitudes.size
@@ -241,6 +443,9 @@ def test_varprodmd_class():
     assert mae < 1
     assert dmd.ssr < 1e-3
 
+    dmd.fit(z[:, ::2], time[::2])
+    assert dmd.dynamics.shape[-1] == 50
+
     dmd = VarProDMD(0, False, "unkown_sort", 0.8)
 
     with pytest.raises(ValueError):
@@ -256,3 +461,86 @@ def test_varprodmd_class():
         mae = np.sum(np.sum(diff, axis=0), axis=-1) / z.shape[0] / z.shape[-1]
         assert dmd.selected_samples.size == int((1 - 0.6) * 100)
         assert mae < 1.0
+
+
+def test_varprodmd_mixed_precision(mocker, snapshots):
+    """
+    Test VarProDMD with a single precision warm start.
+    """
+    z, time = snapshots
+
+    # record the optimizer stages
+    stages = []
+    compute_dmd_varpro = pydmd.varprodmd._compute_dmd_varpro
+
+    def record_stage(*args, **kwargs):
+        stages.append((args[0], args[2].dtype))
+        opt = compute_dmd_varpro(*args, **kwargs)
+        stages[-1] += (opt.x,)
+        return opt
+
+    mocker.patch(
+        "pydmd.varprodmd._compute_dmd_varpro", side_effect=record_stage
+    )
+
+    dmd = VarProDMD(0, False, False, 0, mixed_precision=True)
+    dmd.fit(z, time)
+    assert dmd.eigs.dtype == np.complex128
+    assert dmd.ssr < 1e-3
+    assert np.allclose(dmd.forecast(time), z)
+
+    # the single precision stage ran and warm started the second stage
+    assert [stage[1] for stage in stages] == [np.complex64, np.complex128]
+    assert len(stages[0]) == 3
+    assert np.array_equal(stages[1][0], stages[0][2])
+
+    # a failing single precision stage falls back to the initial guess
+    def fail_single(*args, **kwargs):
+        if args[2].dtype == np.complex64:
+            raise np.linalg.LinAlgError("SVD did not converge")
+        return compute_dmd_varpro(*args, **kwargs)
+
+    mocker.patch("pydmd.varprodmd._compute_dmd_varpro", side_effect=fail_single)
+    with pytest.warns(UserWarning, match="Single precision stage failed"):
+        dmd.fit(z, time)
+    assert dmd.ssr < 1e-3
+
+
+def test_varprodmd_optargs_copy(snapshots):
+    """
+    Test that VarProDMD is not affected by changes of the passed optargs.
+    """
+    z, time = snapshots
+    optargs = dict(OPT_DEF_ARGS)
+    dmd = VarProDMD(0, False, False, 0, optargs)
+    optargs["method"] = "unknown"
+    dmd.fit(z, time)
+    assert dmd.ssr < 1e-3
+
+
+def test_varprodmd_fit_many(snapshots, reference_dmd):
+    """
+    Test fitting independent problems with VarProDMD.fit_many.
+    """
+    z, time = snapshots
+    dmd = reference_dmd
+
+    dmds = dmd.fit_many([z, z[:, ::2]], [time, time[::2]], n_jobs=-1)
+    assert len(dmds) == 2
+    assert np.allclose(dmds[0].forecast(time), dmd.forecast(time))
+    assert np.allclose(dmds[1].forecast(time), z)
+    assert dmds[1].selected_samples.size == 50
+
+    with pytest.raises(ValueError):
+        dmd.fit_many([z], [time, time])
+
+
+def test_varprodmd_time_dtype(snapshots, reference_dmd):
+    """
+    Test that VarProDMD stores the timestamps as real float64.
+    """
+    z, time = snapshots
+    dmd = reference_dmd
+    dmd_list = VarProDMD(0, False, False, 0).fit(z, time.tolist())
+    assert dmd_list.dynamics.dtype == np.complex128
+    assert np.allclose(dmd_list.dynamics, dmd.dynamics)